@@ -22,6 +22,10 @@ const (
 	dockerfile   = "Dockerfile"
 )
 
+// clonedRepositories tracks the checkouts made during an import run,
+// MCPs sharing the same repository and branch reuse the same clone
+var clonedRepositories map[string]bool
+
 var importCmd = &cobra.Command{
 	Use:   "import",
 	Short: "Import MCPs from a config file",
@@ -51,6 +55,7 @@ func runImport(cmd *cobra.Command, args []string) {
 
 	setupTempDirectory()
 	defer os.RemoveAll(tmpDir)
+	clonedRepositories = make(map[string]bool)
 
 	for name, repository := range hub.Repositories {
 		if mcp != "" && mcp != name {
@@ -71,7 +76,10 @@ func processRepository(name string, repository *hub.Repository) (*catalog.Catalo
 		repoPath = repository.Path
 	} else {
 		repoPath = fmt.Sprintf("%s/%s/%s", tmpDir, strings.TrimPrefix(repository.Repository, githubPrefix), repository.Branch)
-		defer git.DeleteRepository(repoPath)
+		// When clones are shared they are removed with the temp directory at the end of the import
+		if clonedRepositories == nil {
+			defer git.DeleteRepository(repoPath)
+		}
 	}
 
 	if repository.Disabled {
@@ -83,10 +91,13 @@ func processRepository(name string, repository *hub.Repository) (*catalog.Catalo
 		return &c, nil
 	}
 
-	if repository.Path == "" {
+	if repository.Path == "" && !clonedRepositories[repoPath] {
 		if _, err := git.CloneRepository(repoPath, repository.Branch, repository.Repository); err != nil {
 			return nil, fmt.Errorf("clone repository: %w", err)
 		}
+		if clonedRepositories != nil {
+			clonedRepositories[repoPath] = true
+		}
 	}
 
 	var cfg *smithery.SmitheryConfig
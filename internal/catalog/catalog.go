@@ -4,9 +4,9 @@ import (
 	"bytes"
 	"encoding/json"
 	"fmt"
+	"io"
 	"net/http"
 	"os"
-	"slices"
 
 	"github.com/blaxel-ai/mcp-hub/internal/hub"
 	"github.com/blaxel-ai/mcp-hub/internal/smithery"
@@ -16,6 +16,9 @@ const (
 	CatalogDir = "catalog"
 )
 
+// httpClient is shared by every SaveArtifact call so connections to the control plane are reused
+var httpClient = &http.Client{}
+
 type Artifact struct {
 	Name            string     `json:"name"`
 	Image           string     `json:"image"`
@@ -85,12 +88,13 @@ func (c *Catalog) SaveArtifact(artifact Artifact) error {
 	req.SetBasicAuth(username, password)
 	req.Header.Set("Content-Type", "application/json")
 
-	client := &http.Client{}
-	resp, err := client.Do(req)
+	resp, err := httpClient.Do(req)
 	if err != nil {
 		return err
 	}
 	defer resp.Body.Close()
+	// Drain the body so the connection can be reused by the next artifact
+	defer io.Copy(io.Discard, resp.Body)
 
 	if resp.StatusCode >= 400 {
 		return fmt.Errorf("failed to save artifact: HTTP %d", resp.StatusCode)
@@ -134,21 +138,23 @@ func (c *Catalog) Load(name string, hub *hub.Repository, imageName string, smith
 	for _, doNotShow := range hub.DoNotShow {
 		hidden[doNotShow] = true
 	}
+	hiddenSecrets := make(map[string]bool)
+	for _, hiddenSecret := range hub.HiddenSecrets {
+		hiddenSecrets[hiddenSecret] = true
+	}
+	required := make(map[string]bool)
+	for _, field := range smithery.StartCommand.ConfigSchema.Required {
+		required[field] = true
+	}
 	for _, secret := range hub.Secrets {
 		p, ok := smithery.StartCommand.ConfigSchema.Properties[secret]
 		if !ok {
 			return fmt.Errorf("secret %s not found in smithery config", secret)
 		}
-		isRequired := false
-		for _, required := range smithery.StartCommand.ConfigSchema.Required {
-			if required == secret {
-				isRequired = true
-			}
-		}
 		secrets[secret] = Field{
 			Description: p.Description,
 			Label:       ToLabel(secret),
-			Required:    isRequired,
+			Required:    required[secret],
 			Hidden:      hidden[secret],
 			Default:     p.Default,
 		}
@@ -158,19 +164,13 @@ func (c *Catalog) Load(name string, hub *hub.Repository, imageName string, smith
 		if _, ok := secrets[name]; ok {
 			continue
 		}
-		if slices.Contains(hub.HiddenSecrets, name) {
+		if hiddenSecrets[name] {
 			continue
 		}
-		isRequired := false
-		for _, required := range smithery.StartCommand.ConfigSchema.Required {
-			if required == name {
-				isRequired = true
-			}
-		}
 		config[name] = Field{
 			Description: property.Description,
 			Label:       ToLabel(name),
-			Required:    isRequired,
+			Required:    required[name],
 			Default:     property.Default,
 		}
 	}
@@ -1,18 +1,23 @@
 package catalog
 
-import "strings"
+import (
+	"strings"
+	"unicode"
+)
 
 func ToLabel(name string) string {
 	// apiKey -> Api Key
-	var result string
+	var result strings.Builder
+	result.Grow(len(name) + 4)
 	for i, char := range name {
-		if i > 0 && char >= 'A' && char <= 'Z' {
-			result += " "
+		if i == 0 {
+			result.WriteRune(unicode.ToUpper(char))
+			continue
 		}
-		result += string(char)
-		if len(result) == 1 {
-			result = strings.ToUpper(result)
+		if char >= 'A' && char <= 'Z' {
+			result.WriteByte(' ')
 		}
+		result.WriteRune(char)
 	}
-	return result
+	return result.String()
 }
@@ -12,6 +12,7 @@ func CloneRepository(path string, branch string, url string) (*git.Repository, e
 		URL:           url,
 		ReferenceName: plumbing.NewBranchReferenceName(branch),
 		SingleBranch:  true,
+		Depth:         1,
 		Progress:      os.Stdout,
 	})
 }